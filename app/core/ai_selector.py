@@ -3,6 +3,7 @@ AI Selector Module
 Claude와 Gemini 두 가지 AI 모델을 호출하는 헬퍼 함수
 """
 import os
+from functools import lru_cache
 from typing import Optional
 from anthropic import Anthropic
 import google.generativeai as genai
@@ -10,6 +11,37 @@ from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+@lru_cache(maxsize=None)
+def get_claude_client(api_key: str) -> Anthropic:
+    """
+    API 키별 Anthropic 클라이언트를 한 번만 생성하여 재사용
+    (HTTP 커넥션 풀을 호출 간에 유지)
+
+    Args:
+        api_key: Anthropic API 키
+
+    Returns:
+        Anthropic: 캐시된 클라이언트 인스턴스
+    """
+    logger.info("Claude 클라이언트 생성")
+    return Anthropic(api_key=api_key)
+
+@lru_cache(maxsize=None)
+def get_gemini_model(api_key: str, model: str) -> genai.GenerativeModel:
+    """
+    API 키/모델별 Gemini 모델 인스턴스를 한 번만 생성하여 재사용
+
+    Args:
+        api_key: Google API 키
+        model: 사용할 모델명
+
+    Returns:
+        genai.GenerativeModel: 캐시된 모델 인스턴스
+    """
+    logger.info(f"Gemini 모델 생성: {model}")
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model)
+
 def ask_claude(prompt: str, model: str = "claude-3-5-sonnet-20241022") -> str:
     """
     Anthropic Claude 모델에 질문하고 응답 받기
@@ -27,7 +59,7 @@ def ask_claude(prompt: str, model: str = "claude-3-5-sonnet-20241022") -> str:
             logger.error("ANTHROPIC_API_KEY 환경 변수가 설정되지 않았습니다.")
             return "Claude 오류: API 키가 설정되지 않았습니다."
 
-        client = Anthropic(api_key=api_key)
+        client = get_claude_client(api_key)
         logger.debug(f"Claude 호출: 모델={model}, 프롬프트 길이={len(prompt)}")
 
         message = client.messages.create(
@@ -61,10 +93,9 @@ def ask_gemini(prompt: str, model: str = "gemini-1.5-flash") -> str:
             logger.error("GOOGLE_API_KEY 환경 변수가 설정되지 않았습니다.")
             return "Gemini 오류: API 키가 설정되지 않았습니다."
 
-        genai.configure(api_key=api_key)
+        model_instance = get_gemini_model(api_key, model)
         logger.debug(f"Gemini 호출: 모델={model}, 프롬프트 길이={len(prompt)}")
 
-        model_instance = genai.GenerativeModel(model)
         response = model_instance.generate_content(prompt)
 
         answer = response.text
@@ -5,7 +5,8 @@ Email Bot Module
 import poplib
 import email
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from app.core.ai_selector import ask_claude, ask_gemini
 from app.modules.excel_logger import save_mail_to_excel
@@ -38,7 +39,7 @@ def fetch_hiworks_emails() -> Dict[str, Any]:
         server.pass_(email_pass)
 
         # 메일 개수 확인
-        num_messages = len(server.list()[1])
+        num_messages, _ = server.stat()
         logger.info(f"연결 성공! 새로운 메일 {num_messages}개가 있습니다.")
 
         # 가장 최근 메일 1개 가져오기 테스트
@@ -50,12 +51,18 @@ def fetch_hiworks_emails() -> Dict[str, Any]:
             subject = msg["Subject"]
             logger.info(f"읽은 메일 제목: {subject}")
 
-            # 2. AI 분석 시작
-            # Gemini로 카테고리 분류 (빠른 분류)
-            category = ask_gemini(f"이 메일 제목을 보고 [재고, 발주, 문의] 중 하나로 분류해줘: {subject}")
-
-            # Claude 3.5로 내용 요약 및 답신 초안
-            analysis = ask_claude(f"이사님 비서로서 다음 메일의 답신 초안을 작성해줘: {msg_content[:500]}")
+            # 2. AI 분석 시작 (분류와 답신 초안은 서로 독립적이므로 동시에 요청)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Gemini로 카테고리 분류 (빠른 분류)
+                category_future = executor.submit(
+                    ask_gemini, f"이 메일 제목을 보고 [재고, 발주, 문의] 중 하나로 분류해줘: {subject}"
+                )
+                # Claude 3.5로 내용 요약 및 답신 초안
+                analysis_future = executor.submit(
+                    ask_claude, f"이사님 비서로서 다음 메일의 답신 초안을 작성해줘: {msg_content[:500]}"
+                )
+                category = category_future.result()
+                analysis = analysis_future.result()
 
             logger.info(f"분류 결과: {category}")
             logger.debug(f"AI 제안 답신: {analysis[:100]}...")
@@ -77,6 +84,39 @@ def fetch_hiworks_emails() -> Dict[str, Any]:
         logger.error(f"이메일 수신 중 오류 발생: {e}", exc_info=True)
         return {"error": str(e)}
 
+def analyze_email(index: int, subject: str, today: str) -> Optional[Dict[str, str]]:
+    """
+    메일 제목을 AI로 분류하고 답신 초안을 생성
+
+    Args:
+        index: POP3 메일 번호 (로그용)
+        subject: 메일 제목
+        today: 기록 날짜 (YYYY-MM-DD)
+
+    Returns:
+        Optional[Dict[str, str]]: 엑셀 기록용 딕셔너리 또는 None
+    """
+    try:
+        logger.info(f"메일 분석 중: {subject}")
+
+        # 분류와 답신 초안은 서로 독립적이므로 동시에 요청
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            category_future = executor.submit(ask_gemini, f"이 메일을 [재고, 발주, 문의] 중 하나로 분류해: {subject}")
+            draft_future = executor.submit(ask_claude, f"다음 메일의 답신 초안을 작성해줘: {subject}")
+            category = category_future.result()
+            draft = draft_future.result()
+
+        return {
+            "날짜": today,
+            "제목": subject,
+            "분류": category,
+            "답신초안": draft,
+            "상태": "완료"
+        }
+    except Exception as e:
+        logger.error(f"메일 {index} 처리 중 오류: {e}")
+        return None
+
 def fetch_and_record_emails() -> Dict[str, Any]:
     """
     하이웍스 메일을 가져와 분석하고 엑셀에 기록
@@ -99,38 +139,33 @@ def fetch_and_record_emails() -> Dict[str, Any]:
         server.user(email_user)
         server.pass_(email_pass)
 
-        num_messages = len(server.list()[1])
+        num_messages, _ = server.stat()
         if num_messages == 0:
             logger.info("새로운 메일이 없습니다.")
             return {"count": 0, "message": "새로운 메일이 없습니다."}
 
-        processed_data: List[Dict[str, str]] = []
-        # 최신 메일 3개 분석
+        # 같은 배치의 기록 날짜는 동일하므로 한 번만 계산
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        # 최신 메일 3개 수신 (POP3 연결은 순차적으로만 사용 가능)
+        messages: List[Tuple[int, str]] = []
         for i in range(num_messages, max(0, num_messages - 3), -1):
             try:
                 _, lines, _ = server.retr(i)
                 msg_content = b'\n'.join(lines).decode('utf-8', errors='ignore')
                 msg = email.message_from_string(msg_content)
-                subject = msg["Subject"]
-
-                logger.info(f"메일 분석 중: {subject}")
-
-                # 2. AI 분석 진행
-                category = ask_gemini(f"이 메일을 [재고, 발주, 문의] 중 하나로 분류해: {subject}")
-                draft = ask_claude(f"다음 메일의 답신 초안을 작성해줘: {subject}")
-
-                record = {
-                    "날짜": datetime.now().strftime("%Y-%m-%d"),
-                    "제목": subject,
-                    "분류": category,
-                    "답신초안": draft,
-                    "상태": "완료"
-                }
-                processed_data.append(record)
+                messages.append((i, msg["Subject"]))
             except Exception as e:
                 logger.error(f"메일 {i} 처리 중 오류: {e}")
                 continue
 
+        # 2. AI 분석 진행 (메일 간 의존성이 없으므로 병렬 호출)
+        processed_data: List[Dict[str, str]] = []
+        if messages:
+            with ThreadPoolExecutor(max_workers=len(messages)) as executor:
+                results = executor.map(lambda m: analyze_email(m[0], m[1], today), messages)
+                processed_data = [record for record in results if record is not None]
+
         # 3. 엑셀 저장 실행 (드롭박스 경로로 저장)
         if processed_data:
             save_mail_to_excel(processed_data)
@@ -8,6 +8,7 @@ from typing import List, Dict, Any
 from datetime import datetime
 from dotenv import load_dotenv
 from app.utils.logger import setup_logger
+from app.utils.file_utils import save_excel_atomic
 
 load_dotenv()
 logger = setup_logger(__name__)
@@ -52,11 +53,11 @@ def save_mail_to_excel(data_list: List[Dict[str, Any]]) -> Dict[str, Any]:
             # 기존 파일이 있으면 불러와서 합치기
             existing_df = pd.read_excel(file_path)
             combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-            combined_df.to_excel(file_path, index=False)
+            save_excel_atomic(combined_df, file_path)
             logger.info(f"기존 파일에 {len(data_list)}건 추가: {file_path}")
         else:
             # 파일이 없으면 새로 생성
-            new_df.to_excel(file_path, index=False)
+            save_excel_atomic(new_df, file_path)
             logger.info(f"새 파일 생성: {file_path}, {len(data_list)}건 저장")
 
         return {
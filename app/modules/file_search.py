@@ -48,13 +48,21 @@ def search_files_with_permission(keyword: str, max_results: int = 50) -> Dict[st
     try:
         logger.info(f"파일 검색 시작: 키워드='{keyword}', 최대 결과={max_results}")
 
+        # 키워드 소문자 변환은 루프 밖에서 한 번만 수행
+        keyword_lower = keyword.lower()
+
         for root, dirs, files in os.walk(DROPBOX_PATH):
             # '회사 자료' 폴더가 경로에 포함되어 있으면 스킵 (보안 권한 설정)
             if EXCLUDE_FOLDER and EXCLUDE_FOLDER in root:
+                dirs[:] = []
                 continue
 
+            # 제외 폴더는 하위 트리를 아예 탐색하지 않도록 미리 제거
+            if EXCLUDE_FOLDER:
+                dirs[:] = [d for d in dirs if EXCLUDE_FOLDER not in os.path.join(root, d)]
+
             for file in files:
-                if keyword.lower() in file.lower():
+                if keyword_lower in file.lower():
                     file_path = os.path.join(root, file)
                     try:
                         file_size = os.path.getsize(file_path)
@@ -142,18 +150,21 @@ def get_ai_folder_contents() -> Dict[str, Any]:
         initialize_ai_folder()
 
         files: List[Dict[str, Any]] = []
-        for item in os.listdir(AI_WORK_DIR):
-            item_path = os.path.join(AI_WORK_DIR, item)
-            if os.path.isfile(item_path):
+        # scandir은 디렉터리 항목 정보를 함께 반환하므로 파일마다 stat을 반복하지 않음
+        with os.scandir(AI_WORK_DIR) as entries:
+            for entry in entries:
                 try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
                     files.append({
-                        "name": item,
-                        "path": item_path,
-                        "size": os.path.getsize(item_path),
-                        "modified": os.path.getmtime(item_path)
+                        "name": entry.name,
+                        "path": entry.path,
+                        "size": stat.st_size,
+                        "modified": stat.st_mtime
                     })
                 except OSError as e:
-                    logger.warning(f"파일 정보 조회 실패: {item_path} - {e}")
+                    logger.warning(f"파일 정보 조회 실패: {entry.path} - {e}")
                     continue
 
         logger.info(f"AI 업무폴더 조회: {len(files)}개 파일")
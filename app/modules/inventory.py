@@ -1,12 +1,23 @@
 import pandas as pd
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from dotenv import load_dotenv
 from app.utils.logger import setup_logger
+from app.utils.file_utils import save_excel_atomic
 
 load_dotenv()
 logger = setup_logger(__name__)
 
+# 재고 관련 파일 경로 구성 요소
+INVENTORY_DIR_NAME = "재고 폴더"
+INVENTORY_FILE_NAME = "실시간_재고현황.xlsx"
+TRANSACTION_LOG_FILE_NAME = "입출고_기록.xlsx"
+INVENTORY_COLUMNS = ['품목명', '현재고', '단위']
+
+# 재고 조회 캐시: (파일 경로, (수정시각 ns, 크기), 재고 목록)
+# 파일이 변경되지 않았으면 엑셀을 다시 읽지 않음
+_inventory_cache: Optional[Tuple[str, Tuple[int, int], List[Dict[str, Any]]]] = None
+
 def get_current_inventory() -> Optional[List[Dict[str, Any]]]:
     """
     드롭박스에서 현재 재고 현황을 조회
@@ -19,18 +30,29 @@ def get_current_inventory() -> Optional[List[Dict[str, Any]]]:
         logger.error("DROPBOX_PATH 환경 변수가 설정되지 않았습니다.")
         return None
 
-    inventory_file = os.path.join(dropbox_path, "재고 폴더", "실시간_재고현황.xlsx")
+    inventory_file = os.path.join(dropbox_path, INVENTORY_DIR_NAME, INVENTORY_FILE_NAME)
 
     if not os.path.exists(inventory_file):
         logger.warning(f"재고 파일을 찾을 수 없습니다: {inventory_file}")
         return None
 
+    global _inventory_cache
+
     try:
-        df = pd.read_excel(inventory_file)
-        # 품목명, 현재고, 규격 등 필요한 정보만 추출
-        inventory_data = df[['품목명', '현재고', '단위']].to_dict(orient='records')
+        stat = os.stat(inventory_file)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+        cached = _inventory_cache
+        if cached is not None and cached[0] == inventory_file and cached[1] == fingerprint:
+            logger.info(f"재고 조회 완료 (캐시): {len(cached[2])}개 품목")
+            return [dict(row) for row in cached[2]]
+
+        # 품목명, 현재고, 단위 등 필요한 열만 읽어서 추출
+        df = pd.read_excel(inventory_file, usecols=INVENTORY_COLUMNS)
+        inventory_data = df[INVENTORY_COLUMNS].to_dict(orient='records')
+        _inventory_cache = (inventory_file, fingerprint, inventory_data)
         logger.info(f"재고 조회 완료: {len(inventory_data)}개 품목")
-        return inventory_data
+        return [dict(row) for row in inventory_data]
     except Exception as e:
         logger.error(f"재고 읽기 오류: {e}", exc_info=True)
         return None
@@ -56,7 +78,7 @@ def record_inventory_transaction(item_name: str, quantity: int, transaction_type
         logger.error("DROPBOX_PATH 환경 변수가 설정되지 않았습니다.")
         return False
 
-    log_file = os.path.join(dropbox_path, "재고 폴더", "입출고_기록.xlsx")
+    log_file = os.path.join(dropbox_path, INVENTORY_DIR_NAME, TRANSACTION_LOG_FILE_NAME)
 
     # 새 기록 데이터
     new_record = {
@@ -78,7 +100,7 @@ def record_inventory_transaction(item_name: str, quantity: int, transaction_type
             logger.info(f"새 입출고 기록 생성: {item_name} {quantity}{transaction_type}")
 
         # 저장
-        df.to_excel(log_file, index=False)
+        save_excel_atomic(df, log_file)
 
         # 재고 현황 업데이트
         update_inventory_stock(item_name, quantity, transaction_type)
@@ -106,7 +128,7 @@ def update_inventory_stock(item_name: str, quantity: int, transaction_type: str)
         logger.error("DROPBOX_PATH 환경 변수가 설정되지 않았습니다.")
         return False
 
-    inventory_file = os.path.join(dropbox_path, "재고 폴더", "실시간_재고현황.xlsx")
+    inventory_file = os.path.join(dropbox_path, INVENTORY_DIR_NAME, INVENTORY_FILE_NAME)
 
     if not os.path.exists(inventory_file):
         logger.error(f"재고 현황 파일이 존재하지 않습니다: {inventory_file}")
@@ -133,7 +155,7 @@ def update_inventory_stock(item_name: str, quantity: int, transaction_type: str)
                 logger.info(f"재고 업데이트: {item_name} {current_stock} -> {new_stock} (출고 -{quantity})")
 
             # 저장
-            df.to_excel(inventory_file, index=False)
+            save_excel_atomic(df, inventory_file)
             return True
         else:
             logger.warning(f"품목 '{item_name}'을 찾을 수 없습니다.")
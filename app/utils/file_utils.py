@@ -0,0 +1,29 @@
+"""
+파일 저장 유틸리티
+엑셀 파일을 임시 파일에 쓴 뒤 교체하여 저장 중 오류가 나도 기존 파일을 보존
+"""
+import os
+import uuid
+import pandas as pd
+
+def save_excel_atomic(df: pd.DataFrame, file_path: str) -> None:
+    """
+    DataFrame을 엑셀 파일로 원자적으로 저장
+
+    같은 폴더의 임시 파일에 먼저 기록한 뒤 os.replace로 교체하므로
+    저장 도중 실패해도 기존 파일이 깨지지 않습니다.
+
+    Args:
+        df: 저장할 DataFrame
+        file_path: 저장할 엑셀 파일 경로
+    """
+    folder_path = os.path.dirname(file_path) or "."
+    tmp_path = os.path.join(folder_path, f"~${uuid.uuid4().hex}.xlsx")
+
+    try:
+        df.to_excel(tmp_path, index=False)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise